@@ -0,0 +1,42 @@
+"""add server defaults for task status and priority
+
+Revision ID: 185dbe2e3054
+Revises: 9a8b90496375
+Create Date: 2026-10-15 11:05:00.222551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '185dbe2e3054'
+down_revision: Union[str, None] = '9a8b90496375'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('tasks', 'status',
+               existing_type=sa.String(length=16),
+               existing_nullable=False,
+               server_default='PENDING')
+    op.alter_column('tasks', 'priority',
+               existing_type=sa.String(length=16),
+               existing_nullable=True,
+               server_default='MEDIUM')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('tasks', 'priority',
+               existing_type=sa.String(length=16),
+               existing_nullable=True,
+               server_default=None)
+    op.alter_column('tasks', 'status',
+               existing_type=sa.String(length=16),
+               existing_nullable=False,
+               server_default=None)
@@ -0,0 +1,30 @@
+"""make lower(name) category index unique
+
+Revision ID: 9a8b90496375
+Revises: b14f5842a8cf
+Create Date: 2026-10-15 10:55:16.218106
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a8b90496375'
+down_revision: Union[str, None] = 'b14f5842a8cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_categories_name_lower', table_name='categories')
+    op.create_index('uq_categories_name_lower', 'categories', [sa.text('lower(name)')], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_categories_name_lower', table_name='categories')
+    op.create_index('ix_categories_name_lower', 'categories', [sa.text('lower(name)')], unique=False)
@@ -0,0 +1,34 @@
+"""add composite indexes for task listing
+
+Revision ID: b14f5842a8cf
+Revises: f571aea4f926
+Create Date: 2026-10-15 10:54:37.961022
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b14f5842a8cf'
+down_revision: Union[str, None] = 'f571aea4f926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_user_id_created_at', 'tasks', ['user_id', sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_tasks_user_id_status_created_at', 'tasks', ['user_id', 'status', sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_tasks_user_id_category_created_at', 'tasks', ['user_id', 'category_id', sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_tasks_user_id_due_date', 'tasks', ['user_id', 'due_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_user_id_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_category_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_status_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_created_at', table_name='tasks')
@@ -0,0 +1,28 @@
+"""add lower(name) index on categories
+
+Revision ID: c1832098f2d9
+Revises: 198c0b53b0a9
+Create Date: 2026-10-15 10:48:57.133645
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1832098f2d9'
+down_revision: Union[str, None] = '198c0b53b0a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_categories_name_lower', 'categories', [sa.text('lower(name)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_name_lower', table_name='categories')
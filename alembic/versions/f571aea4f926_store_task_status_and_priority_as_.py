@@ -0,0 +1,59 @@
+"""store task status and priority as varchar
+
+Revision ID: f571aea4f926
+Revises: c1832098f2d9
+Create Date: 2026-10-15 10:51:28.897415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f571aea4f926'
+down_revision: Union[str, None] = 'c1832098f2d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+taskstatus = postgresql.ENUM('PENDING', 'IN_PROGRESS', 'COMPLETED', name='taskstatus')
+taskpriority = postgresql.ENUM('LOW', 'MEDIUM', 'HIGH', name='taskpriority')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('tasks', 'status',
+               existing_type=taskstatus,
+               type_=sa.String(length=16),
+               existing_nullable=False,
+               postgresql_using='status::text')
+    op.alter_column('tasks', 'priority',
+               existing_type=taskpriority,
+               type_=sa.String(length=16),
+               existing_nullable=True,
+               postgresql_using='priority::text')
+    op.create_check_constraint('ck_tasks_status', 'tasks', "status IN ('PENDING', 'IN_PROGRESS', 'COMPLETED')")
+    op.create_check_constraint('ck_tasks_priority', 'tasks', "priority IN ('LOW', 'MEDIUM', 'HIGH')")
+    taskstatus.drop(op.get_bind(), checkfirst=False)
+    taskpriority.drop(op.get_bind(), checkfirst=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    taskstatus.create(op.get_bind(), checkfirst=False)
+    taskpriority.create(op.get_bind(), checkfirst=False)
+    op.drop_constraint('ck_tasks_priority', 'tasks', type_='check')
+    op.drop_constraint('ck_tasks_status', 'tasks', type_='check')
+    op.alter_column('tasks', 'priority',
+               existing_type=sa.String(length=16),
+               type_=taskpriority,
+               existing_nullable=True,
+               postgresql_using='priority::taskpriority')
+    op.alter_column('tasks', 'status',
+               existing_type=sa.String(length=16),
+               type_=taskstatus,
+               existing_nullable=False,
+               postgresql_using='status::taskstatus')
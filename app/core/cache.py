@@ -0,0 +1,60 @@
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.logging import logger
+
+# Shared Redis client, set up in the app lifespan (None when REDIS_URL is unset)
+redis_client: Optional[redis.Redis] = None
+
+
+def init_cache() -> None:
+    """Create the Redis client if a REDIS_URL is configured"""
+    global redis_client
+    
+    if settings.REDIS_URL:
+        redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+async def close_cache() -> None:
+    """Close the Redis client and its connection pool"""
+    global redis_client
+    
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """Get a cached value; cache misses and Redis errors both return None"""
+    if redis_client is None:
+        return None
+    
+    try:
+        return await redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+async def cache_set(key: str, value: str, ttl: int, only_if_missing: bool = False) -> None:
+    """Cache a value for `ttl` seconds; Redis errors are logged and ignored"""
+    if redis_client is None:
+        return
+    
+    try:
+        await redis_client.set(key, value, ex=ttl, nx=only_if_missing)
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def cache_delete(key: str) -> None:
+    """Drop a cached value; Redis errors are logged and ignored"""
+    if redis_client is None:
+        return
+    
+    try:
+        await redis_client.delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache delete failed for {key}: {e}")
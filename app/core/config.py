@@ -1,3 +1,4 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -14,20 +15,56 @@ class Settings(BaseSettings):
     DB_NAME: str = "postgres"
     DB_HOST: str = "127.0.0.1"
     DB_PORT: str = "5432"
+
+    # Connection pool settings
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_USE_PGBOUNCER: bool = False  # PgBouncer in transaction mode does the pooling
+    
+    # Statement caches (asyncpg's are per connection, ignored with PgBouncer)
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statements
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 512  # SQLAlchemy's asyncpg adapter
+    DB_QUERY_CACHE_SIZE: int = 2048  # SQLAlchemy compiled SQL
     
     # Auth settings
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 43200  # 30 days
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 129600  # 90 days
     SECRET_KEY: str
+    BCRYPT_ROUNDS: int = 12  # Cost factor for new password hashes
+
+    # Rate limit counter storage (use redis:// so all workers share counters)
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    # Reverse proxies in front of the app that append to X-Forwarded-For
+    # (0 = not behind a proxy, rate limit by the socket's peer address)
+    RATE_LIMIT_PROXY_HOPS: int = 0
+
+    # Redis cache for hot lookups (caching is disabled when unset)
+    REDIS_URL: Optional[str] = None
 
     def get_database_url(self, async_driver: bool = True) -> str:
         """
-        Construct database URL from individual parameters
+        Get the database URL (built once per driver, then cached)
         Args:
             async_driver: If True, uses asyncpg driver, otherwise uses sync driver
         """
-            
-        driver = "postgresql+asyncpg" if async_driver else "postgresql"
+        return self.database_url_async if async_driver else self.database_url_sync
+
+    @cached_property
+    def database_url_async(self) -> str:
+        """Database URL using the asyncpg driver"""
+        return self._build_database_url("postgresql+asyncpg")
+
+    @cached_property
+    def database_url_sync(self) -> str:
+        """Database URL using the default sync driver"""
+        return self._build_database_url("postgresql")
+
+    def _build_database_url(self, driver: str) -> str:
+        """
+        Construct database URL from individual parameters
+        """
         base_url = f"{driver}://" + "{user}:{password}@{host}:{port}/{db}"
         
         # Local or other connection
@@ -1,11 +1,48 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from typing import AsyncGenerator
+from uuid import uuid4
 from .config import settings
 
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer owns the pool; asyncpg's prepared statements can't be
+    # shared across the backends it hands out, and their per-connection
+    # numbered names would collide there, so name each one uniquely
+    pool_kwargs = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    pool_kwargs = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        # The same parameterized queries run over and over on each pooled
+        # connection, so keep them prepared server-side
+        "connect_args": {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    }
+
 # Create async engine using the constructed database URL with async driver
-engine = create_async_engine(settings.get_database_url(async_driver=True), echo=True)
+engine = create_async_engine(
+    settings.get_database_url(async_driver=True),
+    # SQL echo writes every statement to stderr; keep it to local development
+    echo=settings.ENVIRONMENT == "development",
+    # Room for every filter combination get_user_tasks can compile
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **pool_kwargs
+)
 
 # Create async session maker
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
@@ -15,8 +52,6 @@ Base = declarative_base()
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database session"""
+    # The context manager closes the session (and rolls back) on exit
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
\ No newline at end of file
+        yield session
\ No newline at end of file
@@ -1,24 +1,110 @@
+import io
 import logging
+import queue
 import sys
-import json
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 import traceback
+from logging.handlers import QueueHandler, QueueListener
+import orjson
 from fastapi import Request
 
 # Configure the root logger
 logger = logging.getLogger("deeplure_research")
 
+# Size of the stdout write buffer used by the console handler
+LOG_BUFFER_SIZE = 8192
+
+# How often buffered log output is flushed (seconds)
+LOG_FLUSH_INTERVAL = 0.5
+
+# Maximum number of request body bytes included in error logs
+MAX_LOGGED_BODY_BYTES = 4096
+
+# Background listener that drains the log queue (started by setup_logging)
+_queue_listener: Optional["FlushingQueueListener"] = None
+_console_handler: Optional[logging.StreamHandler] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that does not flush after every record.
+    Output is flushed by FlushingQueueListener, or immediately for errors.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    QueueListener that also flushes its handlers every `flush_interval` seconds.
+    Flushing happens on the listener thread, so buffered stdout writes never
+    block the event loop.
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level=False, flush_interval=LOG_FLUSH_INTERVAL):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._next_flush = time.monotonic() + flush_interval
+
+    def _flush_handlers(self):
+        for handler in self.handlers:
+            handler.flush()
+        self._next_flush = time.monotonic() + self.flush_interval
+
+    def dequeue(self, block):
+        # Wait for the next record, but no longer than the next flush is due
+        while True:
+            timeout = self._next_flush - time.monotonic()
+            if timeout <= 0:
+                self._flush_handlers()
+                continue
+            try:
+                return self.queue.get(block, timeout=timeout)
+            except queue.Empty:
+                self._flush_handlers()
+
+
+def _buffered_stdout():
+    """Open a block-buffered text stream on stdout's file descriptor"""
+    try:
+        return open(
+            sys.stdout.fileno(),
+            "w",
+            buffering=LOG_BUFFER_SIZE,
+            encoding=sys.stdout.encoding,
+            closefd=False
+        )
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # stdout replaced by something without a real file descriptor
+        return sys.stdout
+
+
 def setup_logging(log_level: str = "INFO"):
     """Configure the application logging"""
+    global _queue_listener, _console_handler, _queue_handler
+    
+    # Replace (rather than stack) handlers from an earlier setup
+    shutdown_logging()
     
     # Set log level based on string input
     level = getattr(logging, log_level.upper())
     
     logger.setLevel(level)
     
-    # Console handler
-    handler = logging.StreamHandler(stream=sys.stdout)
+    # Console handler (block-buffered, see FlushingQueueListener)
+    handler = BufferedStreamHandler(stream=_buffered_stdout())
     handler.setLevel(level)
     
     # Create formatter
@@ -27,16 +113,46 @@ def setup_logging(log_level: str = "INFO"):
     )
     handler.setFormatter(formatter)
     
-    # Add handlers
-    logger.addHandler(handler)
+    # QueueHandler still renders the message (args, exc_info) on the calling
+    # thread; the console formatter and stdout writes run on the listener
+    log_queue = queue.Queue(-1)
+    _queue_handler = QueueHandler(log_queue)
+    logger.addHandler(_queue_handler)
+    
+    _console_handler = handler
+    _queue_listener = FlushingQueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
     
     # Disable propagation to prevent duplicate logs
     logger.propagate = False
     
     return logger
 
+def shutdown_logging():
+    """Flush queued log records and stop the background listener"""
+    global _queue_listener, _console_handler, _queue_handler
+    
+    # Detach first so no record lands in a queue nobody drains any more
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+        _queue_handler = None
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    
+    if _console_handler is not None:
+        _console_handler.flush()
+        if _console_handler.stream is not sys.stdout:
+            _console_handler.stream.close()
+        _console_handler = None
+
 async def log_request_details(request: Request, error: Optional[Exception] = None):
     """Log detailed request information, especially useful for debugging errors"""
+    # Skip building the details entirely if the record would be dropped
+    if not logger.isEnabledFor(logging.ERROR if error else logging.INFO):
+        return
+    
     try:
         # Get request details
         request_details = {
@@ -48,17 +164,23 @@ async def log_request_details(request: Request, error: Optional[Exception] = Non
             "query_params": dict(request.query_params),
         }
         
-        # Try to get the request body if available
-        if hasattr(request, "body"):
+        # Only capture the body when logging an error, capped in size
+        if error and hasattr(request, "body"):
             try:
-                body = await request.body()
+                body = (await request.body())[:MAX_LOGGED_BODY_BYTES]
                 if body:
-                    try:
-                        # Try to decode as JSON
-                        request_details["body"] = json.loads(body.decode("utf-8"))
-                    except:
-                        # If not JSON, store as raw string
-                        request_details["body"] = body.decode("utf-8", errors="replace")
+                    parsed = None
+                    if request.headers.get("content-type", "").startswith("application/json"):
+                        try:
+                            # Try to decode as JSON
+                            parsed = orjson.loads(body)
+                        except orjson.JSONDecodeError:
+                            pass
+                    
+                    # If not JSON (or truncated), store as raw string
+                    if parsed is None:
+                        parsed = body.decode("utf-8", errors="replace")
+                    request_details["body"] = parsed
             except:
                 pass
                 
@@ -71,12 +193,12 @@ async def log_request_details(request: Request, error: Optional[Exception] = Non
             }
             logger.error(
                 f"Request error: {error_details['error_type']}: {error_details['error_message']}\n"
-                f"Request details: {json.dumps(request_details, default=str)}\n"
+                f"Request details: {orjson.dumps(request_details, default=str).decode()}\n"
                 f"Traceback: {error_details['traceback']}"
             )
         else:
             # Regular request logging
-            logger.info(f"Request: {json.dumps(request_details, default=str)}")
+            logger.info(f"Request: {orjson.dumps(request_details, default=str).decode()}")
     
     except Exception as logging_error:
         # Fallback if there's an error during logging
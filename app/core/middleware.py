@@ -0,0 +1,31 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Preconstructed liveness response, identical to the /health route's body
+HEALTH_RESPONSE_BODY = b'{"status":"ok","message":"API is running"}'
+HEALTH_RESPONSE_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(HEALTH_RESPONSE_BODY)).encode()),
+]
+
+
+class HealthCheckMiddleware:
+    """
+    Answer GET /health at the ASGI layer, before rate limiting, routing
+    and dependency resolution run. Register it last so it is outermost.
+    """
+
+    def __init__(self, app: ASGIApp, path: str = "/health"):
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["method"] == "GET" and scope["path"] == self.path:
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": HEALTH_RESPONSE_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": HEALTH_RESPONSE_BODY})
+            return
+        
+        await self.app(scope, receive, send)
@@ -19,4 +19,10 @@ class Category(Base):
     # Relationships
     tasks = relationship("Task", back_populates="category")
 
+    # Case-insensitive name lookups (see get_category_by_name); also the
+    # conflict target for the upsert in get_or_create_category
+    __table_args__ = (
+        Index('uq_categories_name_lower', func.lower(name), unique=True),
+    )
+
 
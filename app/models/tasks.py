@@ -24,8 +24,16 @@ class Task(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(SQLEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False, index=True)
-    priority = Column(SQLEnum(TaskPriority), default=TaskPriority.MEDIUM, nullable=True)
+    # Stored as VARCHAR + CHECK rather than native Postgres enums; the
+    # defaults are the stored member names, filled in by the database
+    status = Column(
+        SQLEnum(TaskStatus, native_enum=False, length=16, create_constraint=True, name="ck_tasks_status"),
+        server_default=TaskStatus.PENDING.name, nullable=False, index=True
+    )
+    priority = Column(
+        SQLEnum(TaskPriority, native_enum=False, length=16, create_constraint=True, name="ck_tasks_priority"),
+        server_default=TaskPriority.MEDIUM.name, nullable=True
+    )
     due_date = Column(DateTime(timezone=True), nullable=True, index=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -33,11 +41,17 @@ class Task(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    # Relationships
-    user = relationship("User", back_populates="tasks")
-    category = relationship("Category", back_populates="tasks")
+    # Relationships (must be eager-loaded explicitly; lazy loads raise
+    # instead of silently issuing one query per task)
+    user = relationship("User", back_populates="tasks", lazy="raise")
+    category = relationship("Category", back_populates="tasks", lazy="raise")
 
-    # Composite index for common query patterns
+    # Composite indexes for common query patterns; the created_at DESC ones
+    # match get_user_tasks' filters plus its newest-first ordering
     __table_args__ = (
         Index('ix_tasks_user_status_due', 'user_id', 'status', 'due_date'),
+        Index('ix_tasks_user_id_created_at', 'user_id', created_at.desc()),
+        Index('ix_tasks_user_id_status_created_at', 'user_id', 'status', created_at.desc()),
+        Index('ix_tasks_user_id_category_created_at', 'user_id', 'category_id', created_at.desc()),
+        Index('ix_tasks_user_id_due_date', 'user_id', 'due_date'),
     )
@@ -1,7 +1,13 @@
+import hashlib
+import time
+
+from cachetools import TLRUCache
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
+from app.core.config import settings
 from app.core.db import get_db
 from app.schemas import auth as schemas
 from app.services import auth as service
@@ -9,7 +15,6 @@ from app.utils import jwt as jwt_utils
 from app.models.user import User
 
 from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -19,7 +24,51 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 # HTTPBearer for refresh token
 security = HTTPBearer()
 
-limiter = Limiter(key_func=get_remote_address)
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Client address to rate limit by
+    Behind RATE_LIMIT_PROXY_HOPS trusted proxies, each appends the address it
+    saw to X-Forwarded-For; entries further left are client-supplied and ignored
+    """
+    if settings.RATE_LIMIT_PROXY_HOPS:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            addresses = forwarded_for.split(",")
+            return addresses[max(len(addresses) - settings.RATE_LIMIT_PROXY_HOPS, 0)].strip()
+    
+    return request.client.host if request.client else "127.0.0.1"
+
+
+limiter = Limiter(
+    key_func=rate_limit_key,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy="moving-window"
+)
+
+# Max time an authenticated user is served from cache before re-reading the DB
+USER_CACHE_TTL_SECONDS = 60
+
+
+def _user_cache_ttu(key, value, now):
+    """Cached users expire after USER_CACHE_TTL_SECONDS or with their token"""
+    _, token_exp = value
+    return now + min(USER_CACHE_TTL_SECONDS, token_exp - time.time())
+
+
+# Access token digest -> (User, token exp timestamp)
+_user_cache = TLRUCache(maxsize=10_000, ttu=_user_cache_ttu)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2s(token.encode("utf-8"), digest_size=16).digest()
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop every cached access token entry belonging to the given user"""
+    stale_keys = [key for key, (user, _) in _user_cache.items() if user.id == user_id]
+    for key in stale_keys:
+        _user_cache.pop(key, None)
 
 
 async def get_current_user(
@@ -28,7 +77,15 @@ async def get_current_user(
 ) -> User:
     """
     Dependency to get current authenticated user from access token
+    Users are cached per token for a short time to skip the DB lookup
     """
+    cache_key = _token_cache_key(token)
+    cached = _user_cache.get(cache_key)
+    if cached:
+        # Copy the shared cached user into this request's session without
+        # querying, so handlers get an attached instance either way
+        return await db.merge(cached[0], load=False)
+    
     # Verify access token
     payload = jwt_utils.verify_token(token, token_type="access")
     if not payload:
@@ -55,6 +112,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
     
+    _user_cache[cache_key] = (user, payload["exp"])
     return user
 
 
@@ -95,13 +153,15 @@ async def login(
         )
     
     # Create tokens
-    access_token = jwt_utils.create_access_token(data={"sub": str(user.id)})
-    refresh_token = jwt_utils.create_refresh_token(data={"sub": str(user.id)})
+    access_token, refresh_token = jwt_utils.create_token_pair(user.id.hex)
     
-    return schemas.TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token
-    )
+    # Fixed-shape payload: skip TokenResponse validation (the model is
+    # still used for the OpenAPI schema)
+    return ORJSONResponse({
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
+    })
 
 @router.post("/refresh", response_model=schemas.TokenResponse)
 async def refresh(
@@ -126,10 +186,13 @@ async def refresh(
             detail="User not found"
         )
     
-    new_access_token = jwt_utils.create_access_token(data={"sub": str(user.id)})
-    new_refresh_token = jwt_utils.create_refresh_token(data={"sub": str(user.id)})
+    # Make the next authenticated request re-read the user row
+    invalidate_cached_user(user.id)
+    
+    new_access_token, new_refresh_token = jwt_utils.create_token_pair(user.id.hex)
     
-    return schemas.TokenResponse(
-        access_token=new_access_token,
-        refresh_token=new_refresh_token
-    )
\ No newline at end of file
+    return ORJSONResponse({
+        "access_token": new_access_token,
+        "refresh_token": new_refresh_token,
+        "token_type": "bearer"
+    })
\ No newline at end of file
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
@@ -10,6 +12,9 @@ from app.models.user import User
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
+# Validates and dumps the whole category list in one pydantic-core call
+_CATEGORY_LIST_ADAPTER = TypeAdapter(List[schemas.CategoryResponse])
+
 
 @router.post("", response_model=schemas.CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
@@ -41,4 +46,8 @@ async def list_categories(
     List all categories (authenticated users only)
     """
     categories = await service.get_all_categories(db)
-    return categories
\ No newline at end of file
+    
+    # Already validated and JSON-ready: skip FastAPI's response_model pass
+    return ORJSONResponse(
+        _CATEGORY_LIST_ADAPTER.dump_python(_CATEGORY_LIST_ADAPTER.validate_python(categories), mode="json")
+    )
\ No newline at end of file
@@ -0,0 +1,29 @@
+from fastapi import APIRouter
+from sqlalchemy import text
+
+from app.core.db import engine
+
+router = APIRouter(prefix="/health", tags=["Health"], include_in_schema=False)
+
+
+@router.get("")
+async def health_check():
+    """
+    Liveness check
+    GET requests are normally answered by HealthCheckMiddleware first
+    """
+    return {"status": "ok", "message": "API is running"}
+
+
+@router.get("/db")
+async def health_check_db():
+    """
+    Database check on a plain pooled connection (no ORM session)
+    """
+    try:
+        # Test DB connection
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return {"status": "ok", "message": "Database connected"}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
@@ -7,27 +9,30 @@ from datetime import datetime
 from app.core.db import get_db
 from app.schemas import tasks as schemas
 from app.services import tasks as service
-from app.services import categories as category_service
 from app.routers.auth import get_current_user
 from app.models.user import User
 from app.models.tasks import TaskStatus, TaskPriority
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+# Query parameters accepted by the task listing endpoint
+ALLOWED_QUERY_PARAMS = frozenset({"status", "priority", "category", "due_from", "due_to"})
 
-def validate_query_params(request: Request):
+# Validates a whole batch of task rows in a single pydantic-core call
+_TASK_LIST_ADAPTER = TypeAdapter(List[schemas.TaskResponse])
+
+
+async def validate_query_params(request: Request):
     """
     Validate that only allowed query parameters are used
+    Declared async so FastAPI runs it inline instead of in the threadpool
     """
-    allowed_params = {"status", "priority", "category", "due_from", "due_to"}
-    query_params = set(request.query_params.keys())
-    
-    invalid_params = query_params - allowed_params
+    invalid_params = [key for key in request.query_params.keys() if key not in ALLOWED_QUERY_PARAMS]
     
     if invalid_params:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid query parameter(s): {', '.join(invalid_params)}. Allowed parameters: {', '.join(allowed_params)}"
+            detail=f"Invalid query parameter(s): {', '.join(invalid_params)}. Allowed parameters: {', '.join(ALLOWED_QUERY_PARAMS)}"
         )
 
 
@@ -44,14 +49,10 @@ async def create_task(
     """
     new_task = await service.create_task(db, task_data, current_user.id)
     
-    # Fetch category name for response
-    if new_task.category_id:
-        category = await category_service.get_category_by_id(db, new_task.category_id)
-        task_response = schemas.TaskResponse.model_validate(new_task)
-        task_response.category_name = category.name if category else None
-        return task_response
-    
-    return new_task
+    # Category is attached by the service, no extra lookup needed
+    task_response = schemas.TaskResponse.model_validate(new_task)
+    task_response.category_name = new_task.category.name if new_task.category else None
+    return task_response
 
 
 @router.get("", response_model=List[schemas.TaskResponse], dependencies=[Depends(validate_query_params)])
@@ -82,16 +83,16 @@ async def list_tasks(
         due_date_to=due_date_to
     )
     
-    # Enrich with category names
+    # Serialize each batch while the next one is still streaming in;
+    # rows already carry category_name from the join
     task_responses = []
-    for task in tasks:
-        task_response = schemas.TaskResponse.model_validate(task)
-        if task.category_id:
-            category = await category_service.get_category_by_id(db, task.category_id)
-            task_response.category_name = category.name if category else None
-        task_responses.append(task_response)
+    async for batch in tasks.partitions():
+        task_responses.extend(
+            _TASK_LIST_ADAPTER.dump_python(_TASK_LIST_ADAPTER.validate_python(batch), mode="json")
+        )
     
-    return task_responses
+    # Already validated and JSON-ready: skip FastAPI's response_model pass
+    return ORJSONResponse(task_responses)
 
 
 @router.get("/{task_id}", response_model=schemas.TaskResponse)
@@ -113,9 +114,7 @@ async def get_task(
     
     # Enrich with category name
     task_response = schemas.TaskResponse.model_validate(task)
-    if task.category_id:
-        category = await category_service.get_category_by_id(db, task.category_id)
-        task_response.category_name = category.name if category else None
+    task_response.category_name = task.category.name if task.category else None
     
     return task_response
 
@@ -142,9 +141,7 @@ async def update_task(
     
     # Enrich with category name
     task_response = schemas.TaskResponse.model_validate(updated_task)
-    if updated_task.category_id:
-        category = await category_service.get_category_by_id(db, updated_task.category_id)
-        task_response.category_name = category.name if category else None
+    task_response.category_name = updated_task.category.name if updated_task.category else None
     
     return task_response
 
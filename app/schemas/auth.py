@@ -4,6 +4,12 @@ from uuid import UUID
 from datetime import datetime
 import re
 
+# Password strength character classes, compiled once at import
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+_LOWERCASE_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+_SPECIAL_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
 class UserRegister(BaseModel):
     email: EmailStr
     password: str = Field(..., min_length=8)
@@ -24,16 +30,16 @@ class UserRegister(BaseModel):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
         
-        if not re.search(r'[A-Z]', v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError('Password must contain at least one uppercase letter')
         
-        if not re.search(r'[a-z]', v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError('Password must contain at least one lowercase letter')
         
-        if not re.search(r'\d', v):
+        if not _DIGIT_RE.search(v):
             raise ValueError('Password must contain at least one digit')
         
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
+        if not _SPECIAL_RE.search(v):
             raise ValueError('Password must contain at least one special character')
         
         return v
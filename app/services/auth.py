@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional
+from sqlalchemy import select, insert
+from typing import Optional, Union
 from uuid import UUID
+import asyncio
 import bcrypt
+from app.core.config import settings
 from app.models import User
 from app.schemas.auth import UserRegister
 
@@ -10,23 +12,27 @@ from app.schemas.auth import UserRegister
 
 
 
-def hash_password(password: str) -> str:
+async def hash_password(password: str) -> str:
     """
     Hash a password using bcrypt.
     Returns the hashed password as a string.
+    Runs in a worker thread so the event loop is not blocked.
     """
     # bcrypt requires bytes
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    hashed = await asyncio.to_thread(bcrypt.hashpw, password.encode('utf-8'), salt)
     return hashed.decode('utf-8')  # store as string in DB
 
 
-def verify_password(password: str, hashed_password: str) -> bool:
+async def verify_password(password: str, hashed_password: str) -> bool:
     """
     Verify a password against a given bcrypt hash.
     Returns True if match, False otherwise.
+    Runs in a worker thread so the event loop is not blocked.
     """
-    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+    return await asyncio.to_thread(
+        bcrypt.checkpw, password.encode('utf-8'), hashed_password.encode('utf-8')
+    )
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
@@ -35,25 +41,36 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     return result.scalar_one_or_none()
 
 
-async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
-    """Get user by ID"""
+async def get_user_by_id(db: AsyncSession, user_id: Union[UUID, str]) -> Optional[User]:
+    """Get user by ID (accepts a UUID or its string form, e.g. a JWT subject)"""
+    # Bind a native UUID so the driver doesn't cast from text
+    if isinstance(user_id, str):
+        try:
+            user_id = UUID(user_id)
+        except ValueError:
+            return None
+    
     result = await db.execute(select(User).where(User.id == user_id))
     return result.scalar_one_or_none()
 
 
 async def create_user(db: AsyncSession, user_data: UserRegister) -> User:
     """Create a new user"""
-    hashed_password = hash_password(user_data.password)
-    new_user = User(
-        email=user_data.email,
-        first_name=user_data.first_name,
-        last_name=user_data.last_name,
-        hashed_password=hashed_password
-    )
+    hashed_password = await hash_password(user_data.password)
     
-    db.add(new_user)
+    # RETURNING brings back server defaults, no refresh needed
+    stmt = (
+        insert(User)
+        .values(
+            email=user_data.email,
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+            hashed_password=hashed_password
+        )
+        .returning(User)
+    )
+    new_user = (await db.execute(stmt)).scalar_one()
     await db.commit()
-    await db.refresh(new_user)
     
     return new_user
 
@@ -65,7 +82,7 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> Opti
     if not user:
         return None
     
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password(password, user.hashed_password):
         return None
     
     return user
\ No newline at end of file
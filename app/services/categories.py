@@ -1,65 +1,159 @@
+import asyncio
+from datetime import datetime
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional, List
+from sqlalchemy.engine import RowMapping
+from sqlalchemy import select, insert, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import make_transient_to_detached
+from typing import Optional, List, Tuple
 from uuid import UUID
 
+from app.core import cache
 from app.models.categories import Category
 from app.schemas.categories import CategoryCreate, CategoryUpdate
 
 
-async def get_category_by_name(db: AsyncSession, name: str) -> Optional[Category]:
-    """Get category by name (case-insensitive)"""
-    result = await db.execute(
-        select(Category).where(Category.name.ilike(name))
+# How long a category stays in the Redis cache (seconds)
+CATEGORY_CACHE_TTL_SECONDS = 3600
+
+
+def _category_cache_key(name: str) -> str:
+    return f"cat:{name.lower()}"
+
+
+async def _get_cached_category(db: AsyncSession, name: str) -> Optional[Category]:
+    """Rebuild a category from the Redis cache and attach it to the session"""
+    cached = await cache.cache_get(_category_cache_key(name))
+    if not cached:
+        return None
+    
+    data = orjson.loads(cached)
+    category = Category(
+        id=UUID(data["id"]),
+        name=data["name"],
+        color=data["color"],
+        created_at=datetime.fromisoformat(data["created_at"])
+    )
+    make_transient_to_detached(category)
+    
+    # load=False: trust the cached row instead of re-selecting it
+    return await db.merge(category, load=False)
+
+
+async def cache_category(category: Category, only_if_missing: bool = False) -> None:
+    """
+    Store a category in the Redis cache under its lowercased name
+    Only call this once the category row is committed
+    """
+    value = orjson.dumps({
+        "id": category.id,
+        "name": category.name,
+        "color": category.color,
+        "created_at": category.created_at
+    }).decode()
+    await cache.cache_set(
+        _category_cache_key(category.name),
+        value,
+        CATEGORY_CACHE_TTL_SECONDS,
+        only_if_missing=only_if_missing
     )
-    return result.scalar_one_or_none()
 
 
-async def get_category_by_id(db: AsyncSession, category_id: UUID) -> Optional[Category]:
-    """Get category by ID"""
+async def get_category_by_name(db: AsyncSession, name: str) -> Optional[Category]:
+    """Get category by name (case-insensitive), served from Redis when cached"""
+    category = await _get_cached_category(db, name)
+    if category:
+        return category
+    
+    # Matches the functional index on lower(name)
     result = await db.execute(
-        select(Category).where(Category.id == category_id)
+        select(Category).where(func.lower(Category.name) == name.lower())
     )
-    return result.scalar_one_or_none()
+    category = result.scalar_one_or_none()
+    
+    if category:
+        await cache_category(category)
+    
+    return category
 
 
-async def get_all_categories(db: AsyncSession) -> List[Category]:
-    """Get all categories"""
-    result = await db.execute(select(Category).order_by(Category.name))
-    return result.scalars().all()
+async def get_all_categories(db: AsyncSession) -> List[RowMapping]:
+    """Get all categories as plain row mappings (no ORM objects)"""
+    result = await db.execute(
+        select(Category.id, Category.name, Category.color, Category.created_at)
+        .order_by(Category.name)
+    )
+    return result.mappings().all()
 
 
 async def create_category(db: AsyncSession, category_data: CategoryCreate) -> Category:
     """Create a new category"""
-    new_category = Category(
-        name=category_data.name,
-        color=category_data.color
+    # RETURNING brings back server defaults, no refresh needed
+    stmt = (
+        insert(Category)
+        .values(name=category_data.name, color=category_data.color)
+        .returning(Category)
     )
-    
-    db.add(new_category)
+    new_category = (await db.execute(stmt)).scalar_one()
     await db.commit()
-    await db.refresh(new_category)
+    
+    # Drop any stale entry cached under the same name
+    await cache.cache_delete(_category_cache_key(new_category.name))
     
     return new_category
 
 
-async def get_or_create_category(db: AsyncSession, category_name: str) -> Category:
-    """Get existing category or create new one"""
-    # Check if category exists (case-insensitive)
-    category = await get_category_by_name(db, category_name)
-    
+async def get_or_create_category(db: AsyncSession, category_name: str) -> Tuple[Category, bool]:
+    """
+    Get existing category or create new one in a single round-trip
+    Uses INSERT ... ON CONFLICT on lower(name), so concurrent requests
+    resolving the same new name can't both insert it
+    Names already in the Redis cache skip the DB entirely
+    Returns (category, from_cache); callers cache it after committing
+    only when from_cache is False
+    """
+    category = await _get_cached_category(db, category_name)
     if category:
-        return category
+        return category, True
     
-    # Create new category
-    new_category = Category(name=category_name)
-    db.add(new_category)
-    await db.commit()
-    await db.refresh(new_category)
+    stmt = (
+        pg_insert(Category)
+        .values(name=category_name)
+        .on_conflict_do_update(
+            index_elements=[func.lower(Category.name)],
+            # No-op update so RETURNING also yields the existing row
+            set_={"name": Category.name}
+        )
+        .returning(Category)
+        .execution_options(populate_existing=True)
+    )
     
-    return new_category
+    # Not committed here: callers commit it together with their own writes
+    return (await db.execute(stmt)).scalar_one(), False
+
+
+# "Personal" category resolved once per process (see ensure_default_category)
+_default_category: Optional[Category] = None
+_default_category_lock = asyncio.Lock()
 
 
 async def ensure_default_category(db: AsyncSession) -> Category:
-    """Ensure 'Personal' category exists and return it"""
-    return await get_or_create_category(db, "Personal")
\ No newline at end of file
+    """Ensure 'Personal' category exists and return it (cached per process)"""
+    global _default_category
+    
+    if _default_category is None:
+        async with _default_category_lock:
+            if _default_category is None:
+                category, from_cache = await get_or_create_category(db, "Personal")
+                # Commit before caching so the cached row is known to exist
+                await db.commit()
+                if not from_cache:
+                    # NX: warm the shared cache once, don't churn it per worker
+                    await cache_category(category, only_if_missing=True)
+                _default_category = category
+                return category
+    
+    # Attach the cached row to this session without querying the DB
+    return await db.merge(_default_category, load=False)
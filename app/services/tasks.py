@@ -1,18 +1,79 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncMappingResult
+from sqlalchemy import select, insert, update, delete, func, and_, bindparam, Select
+from sqlalchemy.orm import selectinload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from itertools import combinations
+from typing import Optional, FrozenSet, Dict
 from uuid import UUID
 from datetime import datetime
 
 from app.models.tasks import Task, TaskStatus , TaskPriority
+from app.models.categories import Category
 from app.schemas.tasks import TaskCreate, TaskUpdate
-from app.services.categories import get_or_create_category, ensure_default_category
+from app.services.categories import get_or_create_category, ensure_default_category, cache_category
+
+# Rows fetched per round-trip when streaming task listings
+TASK_STREAM_BATCH_SIZE = 200
+
+# Columns projected for task listings (same keys as TaskResponse)
+TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.completed_at,
+    Task.category_id,
+    Category.name.label("category_name"),
+    Task.user_id,
+    Task.created_at,
+    Task.updated_at
+)
+
+# Optional get_user_tasks filters, each bound to a parameter of the same name
+TASK_LIST_FILTERS = {
+    "status": Task.status == bindparam("status"),
+    "priority": Task.priority == bindparam("priority"),
+    "category_id": Task.category_id == bindparam("category_id"),
+    "due_date_from": Task.due_date >= bindparam("due_date_from"),
+    "due_date_to": Task.due_date <= bindparam("due_date_to"),
+}
+
+
+def _build_task_list_query(filters: FrozenSet[str]) -> Select:
+    """Build the task listing query for one combination of active filters"""
+    query = (
+        select(*TASK_LIST_COLUMNS)
+        .outerjoin(Category, Task.category_id == Category.id)
+        .where(Task.user_id == bindparam("user_id"))
+    )
+    
+    for name in TASK_LIST_FILTERS:
+        if name in filters:
+            query = query.where(TASK_LIST_FILTERS[name])
+    
+    # Order by created_at descending (newest first)
+    return (
+        query.order_by(Task.created_at.desc())
+        .execution_options(yield_per=TASK_STREAM_BATCH_SIZE)
+    )
+
+
+# One prebuilt query per filter combination (2^5), keyed by the active filters
+_TASK_LIST_QUERIES: Dict[FrozenSet[str], Select] = {
+    frozenset(filters): _build_task_list_query(frozenset(filters))
+    for count in range(len(TASK_LIST_FILTERS) + 1)
+    for filters in combinations(TASK_LIST_FILTERS, count)
+}
 
 
 async def get_task_by_id(db: AsyncSession, task_id: UUID, user_id: UUID) -> Optional[Task]:
     """Get task by ID (only if it belongs to the user)"""
     result = await db.execute(
-        select(Task).where(
+        select(Task)
+        .options(selectinload(Task.category), raiseload("*"))
+        .where(
             and_(Task.id == task_id, Task.user_id == user_id)
         )
     )
@@ -27,52 +88,61 @@ async def get_user_tasks(
     category_id: Optional[UUID] = None,
     due_date_from: Optional[datetime] = None,
     due_date_to: Optional[datetime] = None
-) -> List[Task]:
-    """Get all tasks for a user with optional filters"""
-    query = select(Task).where(Task.user_id == user_id)
-    
-    # Apply filters
-    if status:
-        query = query.where(Task.status == status)
-    
-    if priority:
-        query = query.where(Task.priority == priority)
-    
-    if category_id:
-        query = query.where(Task.category_id == category_id)
-    
-    if due_date_from:
-        query = query.where(Task.due_date >= due_date_from)
-    
-    if due_date_to:
-        query = query.where(Task.due_date <= due_date_to)
-    
-    # Order by created_at descending (newest first)
-    query = query.order_by(Task.created_at.desc())
-    
-    result = await db.execute(query)
-    return result.scalars().all()
+) -> AsyncMappingResult:
+    """
+    Stream all tasks for a user with optional filters
+    Yields plain row mappings (TASK_LIST_COLUMNS) rather than Task objects,
+    in batches of TASK_STREAM_BATCH_SIZE so callers can start serializing early
+    """
+    filters = {
+        "status": status,
+        "priority": priority,
+        "category_id": category_id,
+        "due_date_from": due_date_from,
+        "due_date_to": due_date_to,
+    }
+    # Unset (falsy) filters are left out of the query entirely
+    active_filters = {name: value for name, value in filters.items() if value}
+    
+    result = await db.stream(
+        _TASK_LIST_QUERIES[frozenset(active_filters)],
+        {"user_id": user_id, **active_filters}
+    )
+    return result.mappings()
+
+
 async def create_task(db: AsyncSession, task_data: TaskCreate, user_id: UUID) -> Task:
     """Create a new task"""
     # Handle category
     if task_data.category_name:
-        category = await get_or_create_category(db, task_data.category_name)
+        category, from_cache = await get_or_create_category(db, task_data.category_name)
     else:
-        # Default to "Personal" category
+        # Default to "Personal" category (already cached by ensure_default_category)
         category = await ensure_default_category(db)
-    
-    new_task = Task(
-        title=task_data.title,
-        description=task_data.description,
-        priority=task_data.priority,
-        due_date=task_data.due_date,
-        user_id=user_id,
-        category_id=category.id
+        from_cache = True
+    
+    # Single INSERT ... RETURNING, committed together with the category upsert
+    stmt = (
+        insert(Task)
+        .values(
+            title=task_data.title,
+            description=task_data.description,
+            priority=task_data.priority,
+            due_date=task_data.due_date,
+            user_id=user_id,
+            category_id=category.id
+        )
+        .returning(Task)
     )
-    
-    db.add(new_task)
+    new_task = (await db.execute(stmt)).scalar_one()
     await db.commit()
-    await db.refresh(new_task)
+    
+    # Only categories resolved from the DB need writing back to the cache
+    if not from_cache:
+        await cache_category(category, only_if_missing=True)
+    
+    # Attach the already-resolved category without marking the task dirty
+    set_committed_value(new_task, "category", category)
     
     return new_task
 
@@ -83,47 +153,66 @@ async def update_task(
     user_id: UUID,
     task_data: TaskUpdate
 ) -> Optional[Task]:
-    """Update a task"""
-    task = await get_task_by_id(db, task_id, user_id)
-    
-    if not task:
-        return None
-    
+    """Update a task with a single UPDATE ... RETURNING (no prior SELECT)"""
     # Update fields
     update_data = task_data.model_dump(exclude_unset=True)
     
     # Handle category update
-    if "category_name" in update_data and update_data["category_name"]:
-        category = await get_or_create_category(db, update_data["category_name"])
-        task.category_id = category.id
-        del update_data["category_name"]
+    category = None
+    from_cache = True
+    category_name = update_data.pop("category_name", None)
+    if category_name:
+        category, from_cache = await get_or_create_category(db, category_name)
+        update_data["category_id"] = category.id
     
     # Handle status change to completed
     if "status" in update_data and update_data["status"] == TaskStatus.COMPLETED:
-        if not task.completed_at:
-            task.completed_at = datetime.utcnow()
+        # Keep the original completion time if the task was already completed;
+        # otherwise stamp it with the DB clock (returned via RETURNING)
+        update_data["completed_at"] = func.coalesce(Task.completed_at, func.now())
     elif "status" in update_data and update_data["status"] != TaskStatus.COMPLETED:
         # If changing from completed to another status, clear completed_at
-        task.completed_at = None
+        update_data["completed_at"] = None
+    
+    if not update_data:
+        return await get_task_by_id(db, task_id, user_id)
+    
+    stmt = (
+        update(Task)
+        .where(and_(Task.id == task_id, Task.user_id == user_id))
+        .values(**update_data)
+        .returning(Task)
+        .options(selectinload(Task.category), raiseload("*"))
+        .execution_options(synchronize_session=False)
+    )
+    task = (await db.execute(stmt)).scalar_one_or_none()
     
-    # Update other fields
-    for field, value in update_data.items():
-        setattr(task, field, value)
+    # Task missing or not owned: leave any category upsert uncommitted
+    if not task:
+        return None
     
     await db.commit()
-    await db.refresh(task)
+    
+    # Only categories resolved from the DB need writing back to the cache
+    if not from_cache:
+        await cache_category(category, only_if_missing=True)
     
     return task
 
 
 async def delete_task(db: AsyncSession, task_id: UUID, user_id: UUID) -> bool:
-    """Delete a task"""
-    task = await get_task_by_id(db, task_id, user_id)
+    """Delete a task with a single DELETE ... RETURNING"""
+    stmt = (
+        delete(Task)
+        .where(and_(Task.id == task_id, Task.user_id == user_id))
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_id = (await db.execute(stmt)).scalar_one_or_none()
     
-    if not task:
+    if deleted_id is None:
         return False
     
-    await db.delete(task)
     await db.commit()
     
     return True
\ No newline at end of file
@@ -1,37 +1,60 @@
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+import base64
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+import jwt
+import orjson
+from jwt import PyJWTError
 from app.core.config import settings
 
+# HS256 is verified by PyJWT through the stdlib hmac module (OpenSSL-backed)
 ALGORITHM = "HS256"
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create JWT access token"""
-    to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The JOSE header is the same for every token we issue, so encode it once
+_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+
+# HMAC already keyed with SECRET_KEY; copied per token to skip re-keying
+_SIGNER = hmac.new(settings.SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _encode(claims: dict) -> str:
+    """Sign claims as an HS256 JWT using the cached header and HMAC key"""
+    signing_input = _HEADER_SEGMENT + b"." + _b64url(orjson.dumps(claims))
+    signer = _SIGNER.copy()
+    signer.update(signing_input)
+    return (signing_input + b"." + _b64url(signer.digest())).decode("ascii")
+
+
+def _expiry(now: datetime, minutes: int) -> int:
+    """Expiry as a NumericDate (seconds since epoch)"""
+    return int((now + timedelta(minutes=minutes)).timestamp())
 
 
-def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create JWT refresh token"""
-    to_encode = data.copy()
+def create_token_pair(sub: str) -> Tuple[str, str]:
+    """
+    Create an (access_token, refresh_token) pair for the given subject
+    Both tokens share the base claims, header segment and keyed HMAC
+    """
+    now = datetime.now(timezone.utc)
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
+    access_token = _encode({
+        "sub": sub,
+        "exp": _expiry(now, settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        "type": "access"
+    })
+    refresh_token = _encode({
+        "sub": sub,
+        "exp": _expiry(now, settings.REFRESH_TOKEN_EXPIRE_MINUTES),
+        "type": "refresh"
+    })
     
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    return access_token, refresh_token
 
 
 def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
@@ -44,5 +67,5 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
             return None
         
         return payload
-    except JWTError:
-        return None
\ No newline at end of file
+    except PyJWTError:
+        return None
@@ -1,16 +1,18 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Depends
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-from app.core.db import get_db, engine
+from app.core.cache import init_cache, close_cache
+from app.core.db import engine
+from app.core.logging import setup_logging, shutdown_logging
+from app.core.middleware import HealthCheckMiddleware
 from app.routers.auth import router as auth_router
 from app.routers.tasks import router as tasks_router
 from app.routers.categories import router as categories_router
+from app.routers.health import router as health_router
 
 from app.routers.auth import limiter
-from slowapi.util import get_remote_address
 from slowapi.middleware import SlowAPIMiddleware
 
 
@@ -18,16 +20,21 @@ from slowapi.middleware import SlowAPIMiddleware
 async def lifespan(app: FastAPI):
     # Startup: Code here runs before the application starts
     print("Application starting up...")
+    setup_logging()
+    init_cache()
     
     yield  # Application is running
     
     # Shutdown: Code here runs when the application is shutting down
     print("Application shutting down...")
     await engine.dispose()
+    await close_cache()
+    shutdown_logging()
 
 
 app = FastAPI(
     title="Task Management API",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -35,22 +42,12 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_middleware(SlowAPIMiddleware)
 
+# Added last so it wraps everything else: /health skips the limiter entirely
+app.add_middleware(HealthCheckMiddleware)
+
 # Routers
 app.include_router(auth_router)
 app.include_router(tasks_router)
 app.include_router(categories_router)
+app.include_router(health_router)
 
-
-@app.get("/health")
-async def health_check():
-    return {"status": "ok", "message": "API is running"}
-
-
-@app.get("/health/db")
-async def health_check_db(db: AsyncSession = Depends(get_db)):
-    try:
-        # Test DB connection
-        await db.execute(text("SELECT 1"))
-        return {"status": "ok", "message": "Database connected"}
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
\ No newline at end of file